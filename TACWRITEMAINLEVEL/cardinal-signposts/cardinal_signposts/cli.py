@@ -35,7 +35,13 @@ def cli():
     default=10,
     help='Maximum directory depth to traverse'
 )
-def init(path, format, include_tree, max_depth):
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Threads used to write signposts (default: min(32, CPU count * 4))'
+)
+def init(path, format, include_tree, max_depth, jobs):
     """Initialize cardinal signposts in a project."""
     root_path = Path(path).resolve()
     
@@ -45,7 +51,8 @@ def init(path, format, include_tree, max_depth):
         generator = SignpostGenerator(
             root_path=str(root_path),
             format=format,
-            include_tree=include_tree
+            include_tree=include_tree,
+            jobs=jobs
         )
         
         created = generator.create_signposts(max_depth=max_depth)
@@ -68,14 +75,19 @@ def init(path, format, include_tree, max_depth):
     default='.',
     help='Project root path (default: current directory)'
 )
-def validate(path):
+@click.option(
+    '--full/--fail-fast',
+    default=False,
+    help='Report every issue instead of stopping at the first one'
+)
+def validate(path, full):
     """Validate cardinal signposts in a project."""
     root_path = Path(path).resolve()
     
     click.echo(f"Validating signposts in: {root_path}")
     
     try:
-        is_valid = validate_signposts(root_path)
+        is_valid = validate_signposts(root_path, fail_fast=not full)
         
         if is_valid:
             click.echo("✅ All signposts are valid")
@@ -95,7 +107,11 @@ def validate(path):
     help='Project root path (default: current directory)'
 )
 def update(path):
-    """Update cardinal signposts after structure changes."""
+    """Update cardinal signposts after structure changes.
+    
+    Stale signposts are removed from the whole tree, including hidden and
+    excluded directories; new ones are written as by init.
+    """
     root_path = Path(path).resolve()
     
     click.echo(f"Updating signposts in: {root_path}")
@@ -164,21 +180,14 @@ def scan(path, interactive, dry_run):
     
     try:
         generator = SignpostGenerator(root_path=str(root_path))
+        created = generator.create_signposts(dry_run=dry_run)
         
         if dry_run:
             # Just show what would be created
-            click.echo(f"Would create signposts in:")
-            for dirpath, dirnames, _ in os.walk(root_path):
-                dirnames[:] = [
-                    d for d in dirnames 
-                    if not d.startswith('.') 
-                    and d not in ['node_modules', '__pycache__', 'venv']
-                ]
-                rel_path = Path(dirpath).relative_to(root_path)
-                if str(rel_path) != '.':
-                    click.echo(f"  - {rel_path}")
+            click.echo(f"Would create {len(created)} signposts:")
+            for signpost in created:
+                click.echo(f"  - {signpost.relative_to(root_path)}")
         else:
-            created = generator.create_signposts()
             click.echo(f"✅ Created {len(created)} signposts")
             
     except Exception as e:
@@ -1,11 +1,178 @@
 """Core signpost generation functionality."""
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
 
 
+# Directory names never traversed (hidden directories are skipped as well)
+_EXCLUDED_DIRS = frozenset({'node_modules', '__pycache__', 'venv', 'env', '.git'})
+
+# Signpost filenames look like _CARDINAL_<PATH>.txt; matched by slicing
+_SIGNPOST_PREFIX = "_CARDINAL_"
+_SIGNPOST_SUFFIX = ".txt"
+_PREFIX_LEN = len(_SIGNPOST_PREFIX)
+_SUFFIX_LEN = len(_SIGNPOST_SUFFIX)
+
+# Table-driven uppercasing for the (almost always ASCII) path in signpost names
+_UPPER_TRANSLATE = str.maketrans(
+    'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+
+# Known directory basenames and the role reported in their signposts
+_ROLE_MAP: Dict[str, str] = {
+    "src": "Source code",
+    "source": "Source code",
+    "lib": "Library code",
+    "tests": "Test suite",
+    "test": "Test suite",
+    "docs": "Documentation",
+    "documentation": "Documentation",
+    "examples": "Example code",
+    "scripts": "Utility scripts",
+    "config": "Configuration files",
+    "data": "Data files",
+    "models": "Data models",
+    "views": "View templates",
+    "controllers": "Controller logic",
+    "routes": "Route definitions",
+    "middleware": "Middleware components",
+    "utils": "Utility functions",
+    "helpers": "Helper functions",
+    "services": "Service layer",
+    "api": "API implementation",
+    "static": "Static assets",
+    "public": "Public files",
+    "assets": "Asset files",
+    "components": "UI components",
+    "pages": "Page components",
+    "layouts": "Layout components",
+    "hooks": "Custom hooks",
+    "context": "Context providers",
+    "store": "State management",
+    "types": "Type definitions",
+    "interfaces": "Interface definitions",
+    "constants": "Constants",
+    "enums": "Enumerations",
+}
+
+
+# Root signpost text, assembled once at import; each block after the base
+# starts with the blank line that separates it from the previous one
+_ROOT_TEMPLATE_BASE = "\n".join([
+    "═" * 60,
+    "CARDINAL RULES - READ BEFORE ANY OPERATION",
+    "═" * 60,
+    "",
+    "ROOT: {root}/",
+    "HERE: {root}/",
+    "ROLE: Project root directory",
+    "",
+])
+
+_ROOT_RULES_BLOCK = "\n".join([
+    "",
+    "BEFORE GENERATING CODE:",
+    "1. pwd && ls -la",
+    "2. cat _CARDINAL_*.txt (signpost in current directory)",
+    "3. State absolute path out loud",
+    "4. Verify file doesn't already exist",
+    "",
+    "CONSTITUTIONAL RULES:",
+    "- Absolute paths only, never use relative paths",
+    "- ONE config location (verify before creating config)",
+    "- NO new directories without explicit approval",
+    "- Generate ONE file per operation, then STOP",
+    "- All imports must use absolute paths",
+    "",
+    "VIOLATION = HALT IMMEDIATELY",
+    "",
+])
+
+_ROOT_CUSTOM_HEADER = "\nCUSTOM RULES:\n"
+_ROOT_TREE_HEADER = "\nDIRECTORY STRUCTURE:\n"
+
+
+def _iter_dirs(
+    path: str,
+    max_depth: Optional[int] = None,
+    prune: bool = True,
+    rel_parts: Tuple[str, ...] = ()
+) -> Iterator[Tuple[str, Tuple[str, ...], List[str]]]:
+    """Recursively yield (dir_path, rel_parts, file_names) top-down from path.
+    
+    The one directory walk behind creation, update, removal and validation.
+    path itself comes first, with empty rel_parts; rel_parts are the
+    directory names below it, built up during the recursion, so
+    len(rel_parts) is the directory's depth. Uses os.scandir so the
+    directory type comes from the cached dirent instead of an extra stat
+    per entry. Symlinked directories are not followed, directories that
+    cannot be listed are skipped, and with prune, hidden and excluded
+    directories are not entered.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    file_names = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if not prune or (name[:1] != '.' and name not in _EXCLUDED_DIRS):
+                subdirs.append(entry)
+        else:
+            file_names.append(name)
+    
+    yield path, rel_parts, file_names
+    
+    if max_depth is not None and len(rel_parts) >= max_depth:
+        return
+    for entry in subdirs:
+        yield from _iter_dirs(entry.path, max_depth, prune, rel_parts + (entry.name,))
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write pre-encoded data to path with raw os-level calls.
+    
+    Files that already hold exactly data are left untouched, so repeated
+    runs cost a stat (plus a read on size match) instead of a rewrite.
+    """
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return
+    except OSError:
+        pass
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _default_jobs() -> int:
+    """Default number of writer threads; signpost writes are I/O-bound."""
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+@functools.lru_cache(maxsize=4096)
+def _role_for_name(name: str) -> str:
+    """Map a directory basename to its role; basenames repeat across a tree."""
+    dir_name = name.lower()
+    return _ROLE_MAP.get(dir_name) or f"{dir_name.capitalize()} directory"
+
+
 class SignpostGenerator:
     """Generates Cardinal Signpost navigation files for AI assistants."""
     
@@ -15,7 +182,8 @@ class SignpostGenerator:
         format: str = "txt",
         include_rules: bool = True,
         include_tree: bool = False,
-        custom_rules: Optional[Dict[str, str]] = None
+        custom_rules: Optional[Dict[str, str]] = None,
+        jobs: Optional[int] = None
     ):
         """Initialize signpost generator.
         
@@ -25,204 +193,168 @@ class SignpostGenerator:
             include_rules: Include constitutional rules in root signpost
             include_tree: Include directory tree in root signpost
             custom_rules: Custom rules to include in signposts
+            jobs: Number of threads used to write directory signposts
+                (default: min(32, cpu_count * 4))
         """
         self.root_path = Path(root_path).resolve()
         self.format = format
         self.include_rules = include_rules
         self.include_tree = include_tree
         self.custom_rules = custom_rules or {}
+        self.jobs = jobs or _default_jobs()
+        self._root_str = str(self.root_path)
+        self._root_prefix_bytes = b"ROOT: " + os.fsencode(self._root_str) + b"/\n"
         
         if not self.root_path.exists():
             raise ValueError(f"Path does not exist: {self.root_path}")
     
-    def create_signposts(self, max_depth: int = 10) -> List[Path]:
+    def create_signposts(self, max_depth: int = 10, dry_run: bool = False) -> List[Path]:
         """Create signposts throughout the directory structure.
         
         Args:
             max_depth: Maximum directory depth to traverse
+            dry_run: Only report the signposts that would be written
             
         Returns:
-            List of created signpost file paths
+            List of created (or, with dry_run, would-be) signpost file paths
         """
         created = []
         
         # Create root signpost first
-        root_signpost = self._create_root_signpost()
+        root_signpost = self._create_root_signpost(dry_run)
         created.append(root_signpost)
         
-        # Traverse and create signposts for each directory
-        for dirpath, dirnames, _ in os.walk(self.root_path):
-            # Skip hidden directories and common exclusions
-            dirnames[:] = [
-                d for d in dirnames 
-                if not d.startswith('.') 
-                and d not in ['node_modules', '__pycache__', 'venv', 'env', '.git']
+        # Traverse first, then write the independent directory signposts
+        dirs = [
+            (dir_path, rel_parts)
+            for dir_path, rel_parts, _ in _iter_dirs(self._root_str, max_depth)
+            if rel_parts
+        ]
+        if not dry_run and self.jobs > 1 and len(dirs) > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                signposts = list(executor.map(
+                    lambda target: self._create_directory_signpost(*target), dirs
+                ))
+        else:
+            signposts = [
+                self._create_directory_signpost(dir_path, rel_parts, dry_run)
+                for dir_path, rel_parts in dirs
             ]
-            
-            current_path = Path(dirpath)
-            depth = len(current_path.relative_to(self.root_path).parts)
-            
-            if depth == 0 or depth > max_depth:
-                continue
-                
-            signpost = self._create_directory_signpost(current_path)
-            if signpost:
-                created.append(signpost)
+        
+        created.extend(Path(signpost) for signpost in signposts)
         
         return created
     
-    def _create_root_signpost(self) -> Path:
+    def _create_root_signpost(self, dry_run: bool = False) -> Path:
         """Create the root signpost with constitutional rules."""
         signpost_path = self.root_path / "_CARDINAL_ROOT.txt"
+        if dry_run:
+            return signpost_path
         
-        content = self._generate_root_content()
+        content = self._generate_root_content().encode('utf-8')
         
-        signpost_path.write_text(content)
+        _write_bytes(self._root_str + os.sep + "_CARDINAL_ROOT.txt", content)
         return signpost_path
     
-    def _create_directory_signpost(self, dir_path: Path) -> Optional[Path]:
-        """Create a signpost for a specific directory."""
+    def _create_directory_signpost(
+        self, dir_path: str, rel_parts: Tuple[str, ...], dry_run: bool = False
+    ) -> str:
+        """Create a signpost for a specific directory.
+        
+        rel_parts are dir_path's components relative to the project root,
+        as tracked by the traversal. Paths stay plain strings here; callers
+        wrap the returned signpost path in Path where they need one.
+        """
         # Generate signpost filename from path
-        rel_path = dir_path.relative_to(self.root_path)
-        path_parts = [p.upper() for p in rel_path.parts]
-        filename = f"_CARDINAL_{'_'.join(path_parts)}.txt"
+        joined = "_".join(rel_parts)
+        joined = joined.translate(_UPPER_TRANSLATE) if joined.isascii() else joined.upper()
+        filename = _SIGNPOST_PREFIX + joined + _SIGNPOST_SUFFIX
         
-        signpost_path = dir_path / filename
+        signpost_path = dir_path + os.sep + filename
+        if dry_run:
+            return signpost_path
         
         # Determine role/purpose of this directory
         role = self._infer_directory_role(dir_path)
         
         content = self._generate_directory_content(dir_path, role)
         
-        signpost_path.write_text(content)
+        _write_bytes(signpost_path, content)
         return signpost_path
     
     def _generate_root_content(self) -> str:
         """Generate content for root signpost."""
-        lines = [
-            "═" * 60,
-            "CARDINAL RULES - READ BEFORE ANY OPERATION",
-            "═" * 60,
-            "",
-            f"ROOT: {self.root_path}/",
-            f"HERE: {self.root_path}/",
-            f"ROLE: Project root directory",
-            ""
-        ]
+        parts = [_ROOT_TEMPLATE_BASE.format_map({'root': self._root_str})]
         
         if self.include_rules:
-            lines.extend([
-                "BEFORE GENERATING CODE:",
-                "1. pwd && ls -la",
-                "2. cat _CARDINAL_*.txt (signpost in current directory)",
-                "3. State absolute path out loud",
-                "4. Verify file doesn't already exist",
-                "",
-                "CONSTITUTIONAL RULES:",
-                "- Absolute paths only, never use relative paths",
-                "- ONE config location (verify before creating config)",
-                "- NO new directories without explicit approval",
-                "- Generate ONE file per operation, then STOP",
-                "- All imports must use absolute paths",
-                "",
-                "VIOLATION = HALT IMMEDIATELY",
-                ""
-            ])
+            parts.append(_ROOT_RULES_BLOCK)
         
         if self.custom_rules:
-            lines.append("CUSTOM RULES:")
+            parts.append(_ROOT_CUSTOM_HEADER)
             for key, value in self.custom_rules.items():
-                lines.append(f"- {key}: {value}")
-            lines.append("")
+                parts.append(f"- {key}: {value}\n")
         
         if self.include_tree:
-            lines.append("DIRECTORY STRUCTURE:")
-            lines.extend(self._generate_tree(self.root_path))
-            lines.append("")
-        
-        return "\n".join(lines)
-    
-    def _generate_directory_content(self, dir_path: Path, role: str) -> str:
-        """Generate content for a directory signpost."""
-        lines = [
-            f"ROOT: {self.root_path}/",
-            f"HERE: {dir_path}/",
-            f"ROLE: {role}"
-        ]
-        return "\n".join(lines)
+            parts.append(_ROOT_TREE_HEADER)
+            parts.append("\n".join(self._generate_tree(self.root_path)))
+            parts.append("\n")
+        
+        return "".join(parts)
+    
+    def _generate_directory_content(self, dir_path: str, role: str) -> bytes:
+        """Generate encoded content for a directory signpost."""
+        return (
+            self._root_prefix_bytes
+            + b"HERE: " + os.fsencode(dir_path)
+            + b"/\nROLE: " + role.encode('utf-8')
+        )
     
-    def _infer_directory_role(self, dir_path: Path) -> str:
+    def _infer_directory_role(self, dir_path: str) -> str:
         """Infer the role/purpose of a directory based on its name and contents."""
-        dir_name = dir_path.name.lower()
-        
-        role_map = {
-            "src": "Source code",
-            "source": "Source code",
-            "lib": "Library code",
-            "tests": "Test suite",
-            "test": "Test suite",
-            "docs": "Documentation",
-            "documentation": "Documentation",
-            "examples": "Example code",
-            "scripts": "Utility scripts",
-            "config": "Configuration files",
-            "data": "Data files",
-            "models": "Data models",
-            "views": "View templates",
-            "controllers": "Controller logic",
-            "routes": "Route definitions",
-            "middleware": "Middleware components",
-            "utils": "Utility functions",
-            "helpers": "Helper functions",
-            "services": "Service layer",
-            "api": "API implementation",
-            "static": "Static assets",
-            "public": "Public files",
-            "assets": "Asset files",
-            "components": "UI components",
-            "pages": "Page components",
-            "layouts": "Layout components",
-            "hooks": "Custom hooks",
-            "context": "Context providers",
-            "store": "State management",
-            "types": "Type definitions",
-            "interfaces": "Interface definitions",
-            "constants": "Constants",
-            "enums": "Enumerations",
-        }
-        
-        return role_map.get(dir_name, f"{dir_name.capitalize()} directory")
+        return _role_for_name(os.path.basename(dir_path))
     
     def _generate_tree(self, root: Path, prefix: str = "", max_depth: int = 3) -> List[str]:
-        """Generate ASCII tree representation of directory structure."""
-        tree_lines = []
+        """Generate ASCII tree representation of directory structure.
         
-        def build_tree(path: Path, prefix: str, depth: int):
-            if depth > max_depth:
-                return
-                
+        Walks iteratively with an explicit stack over os.scandir entries,
+        so directory checks use the cached dirent type instead of a stat.
+        """
+        def list_entries(path: str) -> List[os.DirEntry]:
             try:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-                # Filter out hidden and excluded
-                items = [
-                    i for i in items 
-                    if not i.name.startswith('.') 
-                    and i.name not in ['node_modules', '__pycache__', 'venv', 'env']
-                ]
-                
-                for i, item in enumerate(items):
-                    is_last = i == len(items) - 1
-                    current_prefix = "└── " if is_last else "├── "
-                    tree_lines.append(f"{prefix}{current_prefix}{item.name}{'/' if item.is_dir() else ''}")
-                    
-                    if item.is_dir():
-                        extension = "    " if is_last else "│   "
-                        build_tree(item, prefix + extension, depth + 1)
+                with os.scandir(path) as it:
+                    # Filter out hidden and excluded
+                    entries = [
+                        e for e in it
+                        if e.name[:1] != '.' and e.name not in _EXCLUDED_DIRS
+                    ]
             except PermissionError:
-                pass
+                return []
+            entries.sort(key=lambda e: (not e.is_dir(), e.name))
+            return entries
+        
+        # Stack of (entry, is_dir, prefix, is_last, depth); children are
+        # pushed in reverse so they pop in sorted order
+        stack = []
+        
+        def push_children(path: str, prefix: str, depth: int) -> None:
+            entries = list_entries(path)
+            last = len(entries) - 1
+            for i in range(last, -1, -1):
+                entry = entries[i]
+                stack.append((entry, entry.is_dir(), prefix, i == last, depth))
+        
+        tree_lines = [f"{root.name}/"]
+        push_children(str(root), "", 0)
+        
+        while stack:
+            entry, is_dir, item_prefix, is_last, depth = stack.pop()
+            current_prefix = "└── " if is_last else "├── "
+            tree_lines.append(f"{item_prefix}{current_prefix}{entry.name}{'/' if is_dir else ''}")
+            
+            if is_dir and depth < max_depth:
+                extension = "    " if is_last else "│   "
+                push_children(entry.path, item_prefix + extension, depth + 1)
         
-        tree_lines.append(f"{root.name}/")
-        build_tree(root, "", 0)
         return tree_lines
     
     def validate(self) -> bool:
@@ -230,20 +362,50 @@ class SignpostGenerator:
         from .validators import validate_signposts
         return validate_signposts(self.root_path)
     
-    def update(self) -> List[Path]:
-        """Update existing signposts after structure changes."""
-        # Remove old signposts
-        self.remove()
-        # Create new ones
-        return self.create_signposts()
+    def update(self, max_depth: int = 10) -> List[Path]:
+        """Update existing signposts after structure changes.
+        
+        Old signposts are removed and new ones written in the same pass
+        over the directory tree. Like remove(), the pass covers the whole
+        tree, including hidden and excluded directories and those below
+        max_depth, so stale signposts there are cleared too; this costs
+        walking directories such as node_modules. New signposts are only
+        written where create_signposts() would write them.
+        """
+        updated = []
+        
+        for dir_path, rel_parts, file_names in _iter_dirs(self._root_str, prune=False):
+            signpost_name = None
+            if len(rel_parts) <= max_depth and not any(
+                part[:1] == '.' or part in _EXCLUDED_DIRS for part in rel_parts
+            ):
+                if not rel_parts:
+                    signpost = self._create_root_signpost()
+                else:
+                    signpost = Path(self._create_directory_signpost(dir_path, rel_parts))
+                updated.append(signpost)
+                signpost_name = signpost.name
+            
+            # Drop stale signposts; an up-to-date one is kept as written
+            for name in file_names:
+                if (
+                    name != signpost_name
+                    and name[:_PREFIX_LEN] == _SIGNPOST_PREFIX
+                    and name[-_SUFFIX_LEN:] == _SIGNPOST_SUFFIX
+                ):
+                    os.unlink(os.path.join(dir_path, name))
+        
+        return updated
     
     def remove(self) -> int:
         """Remove all cardinal signposts from the project."""
         removed = 0
-        for dirpath, _, filenames in os.walk(self.root_path):
-            for filename in filenames:
-                if filename.startswith("_CARDINAL_") and filename.endswith(".txt"):
-                    file_path = Path(dirpath) / filename
-                    file_path.unlink()
+        for dir_path, _, file_names in _iter_dirs(self._root_str, prune=False):
+            for name in file_names:
+                if (
+                    name[:_PREFIX_LEN] == _SIGNPOST_PREFIX
+                    and name[-_SUFFIX_LEN:] == _SIGNPOST_SUFFIX
+                ):
+                    os.unlink(os.path.join(dir_path, name))
                     removed += 1
         return removed
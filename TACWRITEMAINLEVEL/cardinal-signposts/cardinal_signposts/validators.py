@@ -1,15 +1,93 @@
 """Validation utilities for cardinal signposts."""
 
 import os
+import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from .generator import (
+    _PREFIX_LEN,
+    _SIGNPOST_PREFIX,
+    _SIGNPOST_SUFFIX,
+    _SUFFIX_LEN,
+    _iter_dirs,
+)
 
-def validate_signposts(root_path: Path) -> bool:
+# Header fields every signpost must carry, and how much of the file to read
+_REQUIRED_FIELDS = (b"ROOT", b"HERE", b"ROLE")
+_HEADER_BYTES = 4096
+
+# One "FIELD: value" header line; the value excludes padding and trailing slashes
+_HEADER_RE = re.compile(rb'^(ROOT|HERE|ROLE):[ \t]*(.*?)/*[ \t\r]*$', re.MULTILINE)
+
+
+def _scan_project(root_str: str) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (dir_path, signpost_filenames) for every directory in the project.
+    
+    The single traversal shared by validation and coverage measurement.
+    """
+    for dir_path, _, file_names in _iter_dirs(root_str):
+        yield dir_path, [
+            f for f in file_names
+            if f[:_PREFIX_LEN] == _SIGNPOST_PREFIX and f[-_SUFFIX_LEN:] == _SIGNPOST_SUFFIX
+        ]
+
+
+def _directory_issues(
+    dir_path: str, signpost_files: List[str], root_path: Path, root_str: str
+) -> List[str]:
+    """Check one non-root directory's signposts.
+    
+    Args:
+        dir_path: Directory being checked
+        signpost_files: Signpost filenames found in the directory
+        root_path: Project root directory
+        root_str: str(root_path)
+        
+    Returns:
+        List of issues found (empty if the directory is fine)
+    """
+    current_dir = Path(dir_path)
+    
+    if not signpost_files:
+        # Directory should have a signpost
+        return [f"Missing signpost in: {current_dir.relative_to(root_path)}"]
+    
+    issues = []
+    if len(signpost_files) > 1:
+        issues.append(f"Multiple signposts in: {current_dir.relative_to(root_path)}")
+    
+    # Validate content
+    signpost_path = current_dir / signpost_files[0]
+    valid, content_issues = _validate_signpost_content(signpost_path, root_path, root_str)
+    if not valid:
+        issues.extend(content_issues)
+    
+    return issues
+
+
+def _report_issues(issues: List[str]) -> None:
+    """Print validation issues."""
+    print("Validation issues found:")
+    for issue in issues:
+        print(f"  ❌ {issue}")
+
+
+def _coverage(total_dirs: int, dirs_with_signposts: int) -> float:
+    """Percentage of directories with signposts (0-100)."""
+    if total_dirs == 0:
+        return 0.0
+    
+    return (dirs_with_signposts / total_dirs) * 100
+
+
+def validate_signposts(root_path: Path, *, fail_fast: bool = True) -> bool:
     """Validate all signposts in a project.
     
     Args:
         root_path: Project root directory
+        fail_fast: Stop at the first invalid signpost instead of walking the
+            whole project to report every issue
         
     Returns:
         True if all signposts are valid, False otherwise
@@ -23,57 +101,84 @@ def validate_signposts(root_path: Path) -> bool:
         return False
     
     # Validate root signpost content
-    root_valid, root_issues = _validate_signpost_content(root_signpost, root_path)
+    root_str = str(root_path)
+    root_valid, root_issues = _validate_signpost_content(root_signpost, root_path, root_str)
     if not root_valid:
         issues.extend(root_issues)
+        if fail_fast:
+            _report_issues(issues)
+            return False
     
     # Find and validate all signposts
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip excluded directories
-        dirnames[:] = [
-            d for d in dirnames 
-            if not d.startswith('.') 
-            and d not in ['node_modules', '__pycache__', 'venv', 'env', '.git']
-        ]
-        
-        current_dir = Path(dirpath)
-        
+    for dir_path, signpost_files in _scan_project(root_str):
         # Skip root (already checked)
-        if current_dir == root_path:
+        if dir_path == root_str:
             continue
         
-        # Find signpost file
-        signpost_files = [f for f in filenames if f.startswith("_CARDINAL_") and f.endswith(".txt")]
-        
-        if not signpost_files:
-            # Directory should have a signpost
-            issues.append(f"Missing signpost in: {current_dir.relative_to(root_path)}")
-            continue
-        
-        if len(signpost_files) > 1:
-            issues.append(f"Multiple signposts in: {current_dir.relative_to(root_path)}")
-        
-        # Validate content
-        signpost_path = current_dir / signpost_files[0]
-        valid, content_issues = _validate_signpost_content(signpost_path, root_path)
-        if not valid:
-            issues.extend(content_issues)
+        issues.extend(_directory_issues(dir_path, signpost_files, root_path, root_str))
+        if issues and fail_fast:
+            break
     
     if issues:
-        print("Validation issues found:")
-        for issue in issues:
-            print(f"  ❌ {issue}")
+        _report_issues(issues)
         return False
     
     return True
 
 
-def _validate_signpost_content(signpost_path: Path, root_path: Path) -> Tuple[bool, List[str]]:
+def validate_and_measure(root_path: Path) -> Tuple[bool, float]:
+    """Validate all signposts and measure coverage in a single traversal.
+    
+    Equivalent to calling validate_signposts(fail_fast=False) and
+    check_signpost_coverage(), but walks the project only once.
+    
+    Args:
+        root_path: Project root directory
+        
+    Returns:
+        Tuple of (all_signposts_valid, coverage_percentage)
+    """
+    issues = []
+    root_str = str(root_path)
+    
+    # Without a root signpost, validate_signposts() fails without checking
+    # anything else, so only coverage is left to measure
+    root_signpost = root_path / "_CARDINAL_ROOT.txt"
+    if not root_signpost.exists():
+        return False, check_signpost_coverage(root_path)
+    
+    # Validate root signpost content
+    root_valid, root_issues = _validate_signpost_content(root_signpost, root_path, root_str)
+    if not root_valid:
+        issues.extend(root_issues)
+    
+    total_dirs = 0
+    dirs_with_signposts = 0
+    
+    for dir_path, signpost_files in _scan_project(root_str):
+        total_dirs += 1
+        if signpost_files:
+            dirs_with_signposts += 1
+        
+        # Skip root (already checked)
+        if dir_path != root_str:
+            issues.extend(_directory_issues(dir_path, signpost_files, root_path, root_str))
+    
+    if issues:
+        _report_issues(issues)
+    
+    return not issues, _coverage(total_dirs, dirs_with_signposts)
+
+
+def _validate_signpost_content(
+    signpost_path: Path, root_path: Path, root_str: Optional[str] = None
+) -> Tuple[bool, List[str]]:
     """Validate the content of a signpost file.
     
     Args:
         signpost_path: Path to signpost file
         root_path: Project root directory
+        root_str: str(root_path), computed once by callers validating many files
         
     Returns:
         Tuple of (is_valid, list_of_issues)
@@ -81,37 +186,45 @@ def _validate_signpost_content(signpost_path: Path, root_path: Path) -> Tuple[bo
     issues = []
     
     try:
-        content = signpost_path.read_text()
+        fd = os.open(signpost_path, os.O_RDONLY)
+        try:
+            header = os.read(fd, _HEADER_BYTES)
+        finally:
+            os.close(fd)
     except Exception as e:
         return False, [f"Cannot read {signpost_path}: {e}"]
     
+    # Parse the header fields in one regex pass over the raw bytes,
+    # keeping the first occurrence of each
+    fields: Dict[bytes, bytes] = {}
+    for match in _HEADER_RE.finditer(header):
+        fields.setdefault(match.group(1), match.group(2))
+    
     # Check for required fields
-    required_fields = ["ROOT:", "HERE:", "ROLE:"]
-    for field in required_fields:
-        if field not in content:
-            issues.append(f"Missing '{field}' in {signpost_path.relative_to(root_path)}")
+    for field in _REQUIRED_FIELDS:
+        if field not in fields:
+            issues.append(
+                f"Missing '{field.decode()}:' in {signpost_path.relative_to(root_path)}"
+            )
     
     # Validate ROOT path
-    lines = content.split('\n')
-    root_line = next((l for l in lines if l.startswith("ROOT:")), None)
-    if root_line:
-        root_value = root_line.split("ROOT:")[1].strip().rstrip('/')
-        expected_root = str(root_path)
-        if root_value != expected_root:
+    root_value = fields.get(b"ROOT")
+    if root_value is not None:
+        expected_root = root_str if root_str is not None else str(root_path)
+        if root_value != os.fsencode(expected_root):
             issues.append(
                 f"Incorrect ROOT in {signpost_path.relative_to(root_path)}: "
-                f"expected {expected_root}, got {root_value}"
+                f"expected {expected_root}, got {os.fsdecode(root_value)}"
             )
     
     # Validate HERE path
-    here_line = next((l for l in lines if l.startswith("HERE:")), None)
-    if here_line:
-        here_value = here_line.split("HERE:")[1].strip().rstrip('/')
+    here_value = fields.get(b"HERE")
+    if here_value is not None:
         expected_here = str(signpost_path.parent)
-        if here_value != expected_here:
+        if here_value != os.fsencode(expected_here):
             issues.append(
                 f"Incorrect HERE in {signpost_path.relative_to(root_path)}: "
-                f"expected {expected_here}, got {here_value}"
+                f"expected {expected_here}, got {os.fsdecode(here_value)}"
             )
     
     return len(issues) == 0, issues
@@ -129,26 +242,9 @@ def check_signpost_coverage(root_path: Path) -> float:
     total_dirs = 0
     dirs_with_signposts = 0
     
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip excluded directories
-        dirnames[:] = [
-            d for d in dirnames 
-            if not d.startswith('.') 
-            and d not in ['node_modules', '__pycache__', 'venv', 'env', '.git']
-        ]
-        
+    for _, signpost_files in _scan_project(str(root_path)):
         total_dirs += 1
-        
-        # Check if directory has signpost
-        has_signpost = any(
-            f.startswith("_CARDINAL_") and f.endswith(".txt") 
-            for f in filenames
-        )
-        
-        if has_signpost:
+        if signpost_files:
             dirs_with_signposts += 1
     
-    if total_dirs == 0:
-        return 0.0
-    
-    return (dirs_with_signposts / total_dirs) * 100
+    return _coverage(total_dirs, dirs_with_signposts)
@@ -1,5 +1,6 @@
 """Tests for SignpostGenerator."""
 
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -54,6 +55,55 @@ class TestSignpostGenerator:
         src_signpost = temp_project / "src" / "_CARDINAL_SRC.txt"
         assert src_signpost.exists()
     
+    def test_dry_run_writes_nothing(self, temp_project):
+        """Test that dry_run reports signposts without creating them."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        planned = generator.create_signposts(dry_run=True)
+        
+        assert temp_project / "src" / "_CARDINAL_SRC.txt" in planned
+        assert not any(path.exists() for path in planned)
+        assert planned == generator.create_signposts()
+    
+    def test_skips_excluded_directories(self, temp_project):
+        """Test that hidden and excluded directories get no signposts."""
+        (temp_project / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_project / ".cache").mkdir()
+        
+        generator = SignpostGenerator(root_path=str(temp_project))
+        signposts = generator.create_signposts()
+        
+        assert len(signposts) == 5  # root + src, src/models, tests, config
+        assert not list((temp_project / "node_modules").rglob("_CARDINAL_*"))
+        assert not list((temp_project / ".cache").glob("_CARDINAL_*"))
+    
+    def test_max_depth_limits_signposts(self, temp_project):
+        """Test that directories deeper than max_depth are skipped."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        generator.create_signposts(max_depth=1)
+        
+        assert (temp_project / "src" / "_CARDINAL_SRC.txt").exists()
+        assert not (temp_project / "src" / "models" / "_CARDINAL_SRC_MODELS.txt").exists()
+    
+    def test_single_job_matches_threaded_output(self, temp_project):
+        """Test that serial and threaded writes produce the same signposts."""
+        # Fresh copies, so both runs really write every signpost
+        threaded_root = (temp_project.parent / "threaded").resolve()
+        serial_root = (temp_project.parent / "serial").resolve()
+        shutil.copytree(temp_project, threaded_root)
+        shutil.copytree(temp_project, serial_root)
+        
+        threaded = SignpostGenerator(root_path=str(threaded_root), jobs=4).create_signposts()
+        serial = SignpostGenerator(root_path=str(serial_root), jobs=1).create_signposts()
+        
+        assert len(serial) == 5
+        assert [p.relative_to(serial_root) for p in serial] == [
+            p.relative_to(threaded_root) for p in threaded
+        ]
+        for serial_signpost, threaded_signpost in zip(serial, threaded):
+            serial_bytes = serial_signpost.read_bytes().replace(bytes(serial_root), b"<ROOT>")
+            threaded_bytes = threaded_signpost.read_bytes().replace(bytes(threaded_root), b"<ROOT>")
+            assert serial_bytes == threaded_bytes
+    
     def test_signpost_content_has_correct_paths(self, temp_project):
         """Test that signpost content has correct ROOT and HERE paths."""
         generator = SignpostGenerator(root_path=str(temp_project))
@@ -72,6 +122,17 @@ class TestSignpostGenerator:
         
         assert generator.validate() is True
     
+    def test_validate_detects_wrong_here(self, temp_project):
+        """Test that a signpost pointing at the wrong directory fails validation."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        generator.create_signposts()
+        
+        src_signpost = temp_project / "src" / "_CARDINAL_SRC.txt"
+        content = src_signpost.read_text()
+        src_signpost.write_text(content.replace("/src/", "/lib/"))
+        
+        assert generator.validate() is False
+    
     def test_remove_signposts(self, temp_project):
         """Test removal of all signposts."""
         generator = SignpostGenerator(root_path=str(temp_project))
@@ -100,6 +161,46 @@ class TestSignpostGenerator:
         docs_signpost = temp_project / "docs" / "_CARDINAL_DOCS.txt"
         assert docs_signpost.exists()
     
+    def test_update_replaces_stale_signposts(self, temp_project):
+        """Test that update swaps out signposts of renamed directories."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        generator.create_signposts()
+        
+        (temp_project / "config").rename(temp_project / "settings")
+        updated = generator.update()
+        
+        settings = temp_project / "settings"
+        assert [p.name for p in settings.glob("_CARDINAL_*.txt")] == ["_CARDINAL_SETTINGS.txt"]
+        assert len(updated) == 5
+        assert generator.validate() is True
+    
+    def test_update_clears_signposts_outside_traversal(self, temp_project):
+        """Test that update removes stale signposts in hidden directories."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        generator.create_signposts()
+        
+        (temp_project / ".archive").mkdir()
+        (temp_project / "config").rename(temp_project / ".archive" / "config")
+        generator.update()
+        
+        assert list((temp_project / ".archive").rglob("_CARDINAL_*.txt")) == []
+        assert generator.remove() == 4
+    
+    def test_unchanged_signposts_are_not_rewritten(self, temp_project):
+        """Test that re-running leaves up-to-date signposts untouched."""
+        generator = SignpostGenerator(root_path=str(temp_project))
+        generator.create_signposts()
+        
+        src_signpost = temp_project / "src" / "_CARDINAL_SRC.txt"
+        tests_signpost = temp_project / "tests" / "_CARDINAL_TESTS.txt"
+        os.utime(src_signpost, ns=(0, 0))
+        tests_signpost.write_text("stale")
+        
+        generator.update()
+        
+        assert src_signpost.stat().st_mtime_ns == 0
+        assert "ROLE: Test suite" in tests_signpost.read_text()
+    
     def test_custom_rules_in_root(self, temp_project):
         """Test that custom rules are included in root signpost."""
         custom_rules = {
@@ -118,6 +219,25 @@ class TestSignpostGenerator:
         
         assert "RULE_1" in content
         assert "No duplicate configs" in content
+    
+    def test_directory_tree_in_root(self, temp_project):
+        """Test the ASCII tree layout: directories first, then files."""
+        (temp_project / "README.md").write_text("readme")
+        
+        generator = SignpostGenerator(
+            root_path=str(temp_project),
+            include_tree=True
+        )
+        tree = generator._generate_tree(temp_project)
+        
+        assert tree == [
+            "test_project/",
+            "├── config/",
+            "├── src/",
+            "│   └── models/",
+            "├── tests/",
+            "└── README.md",
+        ]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""Tests for signpost validators."""
+
+import tempfile
+import shutil
+from pathlib import Path
+import pytest
+
+from cardinal_signposts import SignpostGenerator
+from cardinal_signposts.validators import (
+    check_signpost_coverage,
+    validate_and_measure,
+    validate_signposts,
+)
+
+
+class TestValidators:
+    """Test suite for validation and coverage helpers."""
+    
+    @pytest.fixture
+    def signposted_project(self):
+        """Create a temporary project with signposts already generated."""
+        temp_dir = tempfile.mkdtemp()
+        project_path = Path(temp_dir) / "test_project"
+        project_path.mkdir()
+        
+        (project_path / "src").mkdir()
+        (project_path / "tests").mkdir()
+        (project_path / "docs").mkdir()
+        
+        SignpostGenerator(root_path=str(project_path)).create_signposts()
+        
+        yield project_path
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_full_coverage(self, signposted_project):
+        """Test coverage of a fully signposted project."""
+        assert check_signpost_coverage(signposted_project) == 100.0
+    
+    def test_validate_and_measure_matches_separate_calls(self, signposted_project):
+        """Test that the combined pass agrees with the individual checks."""
+        (signposted_project / "unmarked").mkdir()
+        
+        valid, coverage = validate_and_measure(signposted_project)
+        
+        assert valid is validate_signposts(signposted_project) is False
+        assert coverage == check_signpost_coverage(signposted_project) == 80.0
+    
+    def test_fail_fast_stops_at_first_issue(self, signposted_project, capsys):
+        """Test that fail_fast reports one issue and full mode reports all."""
+        (signposted_project / "unmarked_a").mkdir()
+        (signposted_project / "unmarked_b").mkdir()
+        
+        assert validate_signposts(signposted_project) is False
+        assert capsys.readouterr().out.count("Missing signpost") == 1
+        
+        assert validate_signposts(signposted_project, fail_fast=False) is False
+        assert capsys.readouterr().out.count("Missing signpost") == 2
+    
+    def test_missing_header_field(self, signposted_project, capsys):
+        """Test that a signpost without a ROLE line fails validation."""
+        signpost = signposted_project / "src" / "_CARDINAL_SRC.txt"
+        header = signpost.read_text().split("\nROLE:")[0]
+        signpost.write_text(header + "/  \n")
+        
+        assert validate_signposts(signposted_project, fail_fast=False) is False
+        assert capsys.readouterr().out.count("❌") == 1
+    
+    def test_missing_root_signpost(self, signposted_project, capsys):
+        """Test that a missing root signpost fails validation."""
+        (signposted_project / "_CARDINAL_ROOT.txt").unlink()
+        (signposted_project / "unmarked").mkdir()
+        
+        assert validate_signposts(signposted_project, fail_fast=False) is False
+        assert validate_and_measure(signposted_project) == (False, 60.0)
+        assert capsys.readouterr().out == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
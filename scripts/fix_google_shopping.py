@@ -9,8 +9,14 @@ Based on official Google documentation:
 - Condition: lowercase only (new, used, refurbished)
 """
 
-import csv
+import os
+import stat
 import sys
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from csv import reader as csv_reader, writer as csv_writer
+from functools import lru_cache
 from pathlib import Path
 
 # Column indices (0-based)
@@ -23,49 +29,137 @@ COL_CUSTOM_PRODUCT = 42  # Google Shopping / Custom Product
 COL_TARGET_GENDER = 67  # Target gender (metafield)
 COL_PRODUCT_CATEGORY = 4  # Product Category
 
+# I/O buffer size for the input and output CSVs (default is 8 KiB)
+IO_BUFFER_SIZE = 4 * 1024 * 1024
 
-def fix_row(row, row_num):
-    """Fix a single row according to Google standards"""
-    changes = []
+# Rows buffered before each writerows() call
+WRITE_BATCH_SIZE = 10_000
+
+# Valid lowercase values accepted by Google Merchant Center
+VALID_GENDERS = frozenset(('male', 'female', 'unisex'))
+VALID_AGES = frozenset(('newborn', 'infant', 'toddler', 'kids', 'adult'))
+
+# The casings Shopify exports actually contain, mapped straight to the
+# valid lowercase value; anything else falls back to normalize_*()
+GENDER_MAP = {form: value for value in VALID_GENDERS
+              for form in (value, value.capitalize(), value.upper())}
+AGE_MAP = {form: value for value in VALID_AGES
+           for form in (value, value.capitalize(), value.upper())}
+
+
+# A feed only ever holds a handful of distinct raw values in these columns,
+# so memoize the normalization per value instead of redoing it every row
+
+@lru_cache(maxsize=None)
+def normalize_gender(value):
+    """Return value lowercased if it is a valid gender, else None"""
+    fixed = value.lower()
+    return fixed if fixed in VALID_GENDERS else None
+
+
+@lru_cache(maxsize=None)
+def normalize_age_group(value):
+    """Return value lowercased if it is a valid age group, else None"""
+    fixed = value.lower()
+    return fixed if fixed in VALID_AGES else None
+
+
+@lru_cache(maxsize=None)
+def parse_target_gender(value):
+    """Return the first valid gender in a target gender metafield, else None
+
+    The metafield may hold several values, like "male; unisex".
+    """
+    target_gender = value.partition(';')[0].strip()
+    if not target_gender.islower():
+        target_gender = target_gender.lower()
+    return target_gender if target_gender in VALID_GENDERS else None
+
+
+def fix_row(row, row_num, change_counts):
+    """Fix a single row according to Google standards
+
+    Each change applied is tallied by type in change_counts. Returns the
+    row and the number of changes made to it.
+    """
+    changes = 0
+    n = len(row)
 
     # Fix Gender (column 39) - must be lowercase
-    if len(row) > COL_GENDER and row[COL_GENDER]:
+    # (values that are already lowercase, the common case, skip lower())
+    if n > COL_GENDER and row[COL_GENDER] and not row[COL_GENDER].islower():
         original = row[COL_GENDER]
-        fixed = original.lower()
-        if fixed in ['male', 'female', 'unisex'] and original != fixed:
+        fixed = GENDER_MAP.get(original)
+        if fixed is None:
+            fixed = normalize_gender(original)
+        if fixed is not None and original != fixed:
             row[COL_GENDER] = fixed
-            changes.append(f"Gender: {original}→{fixed}")
+            change_counts["Gender"] += 1
+            changes += 1
 
     # Fix Age Group (column 40) - must be lowercase
-    if len(row) > COL_AGE_GROUP and row[COL_AGE_GROUP]:
+    if n > COL_AGE_GROUP and row[COL_AGE_GROUP] and not row[COL_AGE_GROUP].islower():
         original = row[COL_AGE_GROUP]
-        fixed = original.lower()
-        valid_ages = ['newborn', 'infant', 'toddler', 'kids', 'adult']
-        if fixed in valid_ages and original != fixed:
+        fixed = AGE_MAP.get(original)
+        if fixed is None:
+            fixed = normalize_age_group(original)
+        if fixed is not None and original != fixed:
             row[COL_AGE_GROUP] = fixed
-            changes.append(f"Age: {original}→{fixed}")
+            change_counts["Age"] += 1
+            changes += 1
 
     # Add Condition (column 42) if empty - default to "new"
-    if len(row) > COL_CONDITION:
-        if not row[COL_CONDITION] or row[COL_CONDITION].strip() == '':
+    if n > COL_CONDITION:
+        if not row[COL_CONDITION] or not row[COL_CONDITION].strip():
             row[COL_CONDITION] = 'new'
-            changes.append("Condition: →new")
+            change_counts["Condition"] += 1
+            changes += 1
 
     # Add Custom Product (column 43) if empty
-    if len(row) > COL_CUSTOM_PRODUCT:
-        if not row[COL_CUSTOM_PRODUCT] or row[COL_CUSTOM_PRODUCT].strip() == '':
+    if n > COL_CUSTOM_PRODUCT:
+        if not row[COL_CUSTOM_PRODUCT] or not row[COL_CUSTOM_PRODUCT].strip():
             row[COL_CUSTOM_PRODUCT] = 'FALSE'
-            changes.append("Custom Product: →FALSE")
+            change_counts["Custom Product"] += 1
+            changes += 1
 
     # Add MPN (column 41) from SKU if empty
-    if len(row) > COL_MPN and len(row) > COL_SKU:
-        if (not row[COL_MPN] or row[COL_MPN].strip() == '') and row[COL_SKU]:
+    if n > COL_MPN:  # COL_MPN > COL_SKU, so the SKU is present too
+        if (not row[COL_MPN] or not row[COL_MPN].strip()) and row[COL_SKU]:
             row[COL_MPN] = row[COL_SKU]
-            changes.append(f"MPN: →{row[COL_SKU]}")
+            change_counts["MPN"] += 1
+            changes += 1
 
     return row, changes
 
 
+@contextmanager
+def open_for_replace(path, **kwargs):
+    """Open a temp file next to path for writing, moved over path on success
+
+    The output only replaces path once it is complete, so path may be the
+    file being read, and a failed run leaves path untouched.
+    """
+    # A unique temp file in path's directory, so os.replace() stays atomic
+    # and no existing file is clobbered
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', **kwargs) as f:
+            # mkstemp creates the file 0600; keep the mode of the file being
+            # replaced, or use the umask default for a new one
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(tmp_path, mode)
+            yield f
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
 def process_csv(input_file, output_file):
     """Process the entire CSV file"""
     print(f"📖 Reading: {input_file}")
@@ -73,92 +167,101 @@ def process_csv(input_file, output_file):
 
     total_rows = 0
     fixed_rows = 0
-    all_changes = []
-
-    with open(input_file, 'r', encoding='utf-8') as infile:
-        reader = csv.reader(infile)
-        rows = list(reader)
-
-    print(f"📊 Total rows: {len(rows):,}")
-    print(f"📊 Product rows: {len(rows)-1:,}\n")
-
-    # Keep header as-is
-    output_rows = [rows[0]]
-
-    # Track last seen values for product-level fields (Shopify CSV format)
-    last_product_data = {
-        'gender': '',
-        'age_group': '',
-        'title': '',
-        'handle': ''
-    }
-
-    # Process data rows
-    for i, row in enumerate(rows[1:], start=2):
-        if not row or len(row) < 10:  # Skip empty/malformed rows
-            output_rows.append(row)
-            continue
-
-        # Track handle changes (new product vs variant)
-        current_handle = row[0] if len(row) > 0 else ''
-
-        # If this is a new product (has title), save its data
-        if len(row) > 1 and row[1].strip():
-            last_product_data['title'] = row[1]
-            last_product_data['handle'] = current_handle
-
-            # Get gender from Google Shopping field or Target gender metafield
-            if len(row) > COL_GENDER and row[COL_GENDER]:
-                last_product_data['gender'] = row[COL_GENDER]
-            elif len(row) > COL_TARGET_GENDER and row[COL_TARGET_GENDER]:
-                # Parse target gender (may have multiple like "male; unisex")
-                target_gender = row[COL_TARGET_GENDER].split(';')[0].strip().lower()
-                if target_gender in ['male', 'female', 'unisex']:
-                    last_product_data['gender'] = target_gender
-                    row[COL_GENDER] = target_gender  # Set it directly too
-                    all_changes.append(f"Row {i}: Copied gender from metafield: '{target_gender}'")
-
-            if len(row) > COL_AGE_GROUP and row[COL_AGE_GROUP]:
-                last_product_data['age_group'] = row[COL_AGE_GROUP]
-        else:
-            # This is a variant row - propagate product-level data
-            if current_handle == last_product_data['handle']:
-                if len(row) > COL_GENDER and not row[COL_GENDER] and last_product_data['gender']:
-                    row[COL_GENDER] = last_product_data['gender']
-                    all_changes.append(f"Row {i}: Propagated gender='{last_product_data['gender']}'")
-                if len(row) > COL_AGE_GROUP and not row[COL_AGE_GROUP] and last_product_data['age_group']:
-                    row[COL_AGE_GROUP] = last_product_data['age_group']
-                    all_changes.append(f"Row {i}: Propagated age_group='{last_product_data['age_group']}'")
-
-        fixed_row, changes = fix_row(row, i)
-        output_rows.append(fixed_row)
-        total_rows += 1
-
-        if changes:
-            fixed_rows += 1
-            all_changes.extend(changes)
-
-    # Write output
-    with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-        writer = csv.writer(outfile)
-        writer.writerows(output_rows)
+    change_counts = Counter()
+
+    # Stream rows from reader to writer so at most one write batch
+    # (plus the last product's data) is ever held in memory
+    with open(input_file, 'r', encoding='utf-8', newline='',
+              buffering=IO_BUFFER_SIZE) as infile, \
+            open_for_replace(output_file, encoding='utf-8', newline='',
+                             buffering=IO_BUFFER_SIZE) as outfile:
+        # csv's reader/writer are C-implemented. Rows are written in batches
+        # with one writerows() call each; bind append once so the per-row
+        # loop skips the attribute lookup
+        reader = csv_reader(infile)
+        writerows = csv_writer(outfile).writerows
+        batch = []
+        append = batch.append
+
+        # Keep header as-is
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{input_file} is empty")
+        append(header)
+        rows_read = 1
+
+        # Track last seen values for product-level fields (Shopify CSV format).
+        # Plain locals rather than a dict: they are read on every variant row
+        product_handle = ''
+        product_gender = ''
+        product_age_group = ''
+
+        # Process data rows
+        for i, row in enumerate(reader, start=2):
+            rows_read += 1
+
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writerows(batch)
+                batch.clear()
+
+            if not row or len(row) < 10:  # Skip empty/malformed rows
+                append(row)
+                continue
+
+            n = len(row)
+
+            # Track handle changes (new product vs variant)
+            # (rows shorter than 10 columns were skipped above)
+            current_handle = row[0]
+
+            # If this is a new product (has title), save its data
+            if row[1].strip():
+                product_handle = current_handle
+
+                # Get gender from Google Shopping field or Target gender metafield
+                if n > COL_GENDER and row[COL_GENDER]:
+                    product_gender = row[COL_GENDER]
+                elif n > COL_TARGET_GENDER and row[COL_TARGET_GENDER]:
+                    target_gender = parse_target_gender(row[COL_TARGET_GENDER])
+                    if target_gender is not None:
+                        product_gender = target_gender
+                        row[COL_GENDER] = target_gender  # Set it directly too
+                        change_counts["Gender from metafield"] += 1
+
+                if n > COL_AGE_GROUP and row[COL_AGE_GROUP]:
+                    product_age_group = row[COL_AGE_GROUP]
+            else:
+                # This is a variant row - propagate product-level data
+                if current_handle == product_handle:
+                    if n > COL_GENDER and not row[COL_GENDER] and product_gender:
+                        row[COL_GENDER] = product_gender
+                        change_counts["Propagated gender"] += 1
+                    if n > COL_AGE_GROUP and not row[COL_AGE_GROUP] and product_age_group:
+                        row[COL_AGE_GROUP] = product_age_group
+                        change_counts["Propagated age group"] += 1
+
+            fixed_row, changes = fix_row(row, i, change_counts)
+            append(fixed_row)
+            total_rows += 1
+
+            if changes:
+                fixed_rows += 1
+
+        writerows(batch)
 
     # Summary
     print("✅ PROCESSING COMPLETE\n")
+    print(f"📊 Total rows: {rows_read:,}")
+    print(f"📊 Product rows: {rows_read-1:,}\n")
     print(f"📊 Statistics:")
     print(f"   Total product rows: {total_rows:,}")
     print(f"   Rows modified: {fixed_rows:,}")
-    print(f"   Total changes: {len(all_changes):,}\n")
+    print(f"   Total changes: {sum(change_counts.values()):,}\n")
 
     # Change breakdown
-    change_types = {}
-    for change in all_changes:
-        change_type = change.split(':')[0]
-        change_types[change_type] = change_types.get(change_type, 0) + 1
-
-    if change_types:
+    if change_counts:
         print("🔧 Changes by type:")
-        for change_type, count in sorted(change_types.items()):
+        for change_type, count in sorted(change_counts.items()):
             print(f"   {change_type}: {count:,}")
 
     print(f"\n💾 Saved to: {output_file}")